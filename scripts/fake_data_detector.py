@@ -18,21 +18,68 @@ ML 학습 코드에서 가짜/무의미한 데이터 생성 패턴을 탐지합
 환경 변수:
     FAKE_DATA_FEATURE_PATTERNS: 피처 변수 패턴 (콤마 구분)
     FAKE_DATA_EXCLUDE_PATHS: 제외 경로 (콤마 구분)
+    FAKE_DATA_CACHE_DIR: 스캔 결과 캐시 디렉토리 (설정 시에만 캐시 사용)
 
 Created: 2026-01-21
 Repository: https://github.com/unohee/ci-templates
 """
 
 import ast
+import hashlib
+import json
 import os
 import re
 import sys
-from dataclasses import dataclass, field
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import List, Optional
-
-
-@dataclass
+from typing import Dict, List, Optional, Set
+
+# 텍스트 패턴 (모듈 로드 시 1회 컴파일, 디코딩 없이 바이트 단위 매칭)
+# 소스 전체에 실행하므로 한 라인 안에서만 매칭되도록 개행은 제외
+_KO_DONE = "완료".encode("utf-8")
+_RE_FAKE_SUCCESS = re.compile(
+    rb'print[^\S\n]*\([^\S\n]*["\'][^\n]*(?:' + _KO_DONE + rb'|success|done)', re.IGNORECASE
+)
+# TODO는 라인 어디든, pass는 주석(#) 이전 코드 부분에 있어야 함
+_RE_TODO_PASS = re.compile(rb"^[^#\n]*pass[^\n]*TODO|^[^#\n]*TODO[^#\n]*pass", re.MULTILINE)
+
+# 피처 변수 패턴 (소문자 비교용으로 로드 시 1회 정규화)
+_FEATURE_PATTERNS = tuple(
+    p.strip().lower()
+    for p in os.environ.get("FAKE_DATA_FEATURE_PATTERNS", "feature,program,arbitrage").split(",")
+    if p.strip()
+)
+
+# AST 순회 중 스코프 종료 시점 표식
+_LEAVE_FUNCTION = object()
+_LEAVE_CLASS = object()
+# 하위에 탐지 대상 노드가 올 수 없는 AST 필드 (순회 생략)
+_LEAF_FIELDS = frozenset(["ctx", "op", "ops"])
+
+# 인스턴스 __dict__ 제거로 대량 이슈 생성 시 메모리 절감 (slots 인자는 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 이보다 파일이 적으면 프로세스 풀 없이 순차 스캔
+PARALLEL_MIN_FILES = 32
+SCAN_CHUNK_SIZE = 16
+
+# 스캔하지 않는 디렉토리 (탐색 중 가지치기)
+# 디렉토리 이름 부분 문자열로 비교 (venv311, .venv-py312, myvenv 등 포함)
+EXCLUDE_DIR_SET = frozenset([
+    "__pycache__",
+    ".git",
+    "trash",
+    "archive",
+    ".venv",
+    "venv",
+    "node_modules",
+])
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Issue:
     """탐지된 이슈"""
     severity: str  # CRITICAL, WARNING, INFO
@@ -43,25 +90,46 @@ class Issue:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DetectionResult:
-    """탐지 결과"""
+    """탐지 결과
+
+    심각도 카운터는 add()/extend()로만 갱신되므로 issues에 직접 append하지 말 것
+    """
     issues: List[Issue] = field(default_factory=list)
     files_scanned: int = 0
+    severity_counts: Dict[str, int] = field(
+        default_factory=lambda: {"CRITICAL": 0, "WARNING": 0, "INFO": 0}
+    )
+
+    def __post_init__(self):
+        # 생성 시 전달된 issues로 카운터 초기화
+        for issue in self.issues:
+            self.severity_counts[issue.severity] = self.severity_counts.get(issue.severity, 0) + 1
+
+    def add(self, issue: Issue):
+        """이슈 추가 (심각도 카운터 갱신)"""
+        self.issues.append(issue)
+        self.severity_counts[issue.severity] = self.severity_counts.get(issue.severity, 0) + 1
+
+    def extend(self, issues: List[Issue]):
+        """이슈 일괄 추가"""
+        for issue in issues:
+            self.add(issue)
 
     @property
     def critical_count(self) -> int:
-        return sum(1 for i in self.issues if i.severity == "CRITICAL")
+        return self.severity_counts["CRITICAL"]
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for i in self.issues if i.severity == "WARNING")
+        return self.severity_counts["WARNING"]
 
     @property
     def bs_score(self) -> float:
         """BS 지수 계산: CRITICAL×10 + WARNING×3 + INFO×1"""
         weights = {"CRITICAL": 10, "WARNING": 3, "INFO": 1}
-        total = sum(weights.get(i.severity, 1) for i in self.issues)
+        total = sum(weights.get(sev, 1) * n for sev, n in self.severity_counts.items())
         return total / max(self.files_scanned, 1)
 
     @property
@@ -69,15 +137,18 @@ class DetectionResult:
         return self.critical_count == 0
 
 
-class FakeDataDetector(ast.NodeVisitor):
+class FakeDataDetector:
     """AST 기반 가짜 데이터 패턴 탐지기"""
 
-    # 가짜 데이터 생성 패턴
+    # 가짜 데이터 생성 패턴 (numpy.* 호출은 np.* 로 정규화 후 조회)
     FAKE_DATA_PATTERNS = {
         # np.random으로 피처 생성
         "np.random.rand": "CRITICAL",
         "np.random.randn": "CRITICAL",
+        "np.random.randint": "CRITICAL",
         "np.random.random": "CRITICAL",
+        "np.random.random_sample": "CRITICAL",
+        "np.random.random_integers": "CRITICAL",
         "np.random.uniform": "CRITICAL",
         "np.random.normal": "CRITICAL",
         "np.random.choice": "WARNING",  # 샘플링은 WARNING
@@ -86,6 +157,11 @@ class FakeDataDetector(ast.NodeVisitor):
         # faker 라이브러리
         "faker.Faker": "WARNING",
     }
+    # FAKE_DATA_PATTERNS 키의 모듈 접두사 (대부분의 호출을 조회 없이 건너뜀)
+    # 패턴 테이블에서 파생하므로 패턴 추가 시 별도 수정 불필요
+    _TRIGGER_PREFIXES = tuple(sorted({
+        name.rsplit(".", 1)[0] + "." for name in FAKE_DATA_PATTERNS
+    }))
 
     # 허용된 컨텍스트 (테스트, 시드 설정 등)
     ALLOWED_CONTEXTS = [
@@ -96,26 +172,24 @@ class FakeDataDetector(ast.NodeVisitor):
         "shuffle",
         "sample",
     ]
+    _ALLOWED_TUPLE = tuple(ALLOWED_CONTEXTS)
 
     # 피처 변수 패턴 (환경 변수로 설정 가능)
-    FEATURE_PATTERNS = os.environ.get(
-        "FAKE_DATA_FEATURE_PATTERNS",
-        "feature,program,arbitrage"
-    ).split(",")
+    FEATURE_PATTERNS = _FEATURE_PATTERNS
 
-    def __init__(self, source: str, filename: str):
+    def __init__(self, source: bytes, filename: str):
         self.source = source
         self.filename = filename
-        self.lines = source.split("\n")
         self.issues: List[Issue] = []
         self.current_function: Optional[str] = None
         self.current_class: Optional[str] = None
+        self._context_lower: Optional[str] = None  # 스코프 변경 시 무효화
 
     def detect(self) -> List[Issue]:
         """전체 탐지 실행"""
         try:
-            tree = ast.parse(self.source)
-            self.visit(tree)
+            tree = ast.parse(self.source, filename=self.filename)
+            self._walk(tree)
         except SyntaxError:
             pass  # 구문 오류는 무시 (다른 도구가 처리)
 
@@ -124,52 +198,86 @@ class FakeDataDetector(ast.NodeVisitor):
 
         return self.issues
 
-    def visit_FunctionDef(self, node):
-        self.current_function = node.name
-        self.generic_visit(node)
-        self.current_function = None
-
-    def visit_AsyncFunctionDef(self, node):
-        self.current_function = node.name
-        self.generic_visit(node)
-        self.current_function = None
-
-    def visit_ClassDef(self, node):
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = None
+    def _walk(self, tree: ast.AST):
+        """명시적 스택 기반 전위 순회 (NodeVisitor 재귀/동적 디스패치 대체)"""
+        handlers = {
+            ast.Call: self.visit_Call,
+            ast.Assign: self.visit_Assign,
+            ast.ExceptHandler: self.visit_ExceptHandler,
+        }
+        AST = ast.AST
+        stack = [tree]
+        pop, push = stack.pop, stack.append
+
+        while stack:
+            node = pop()
+
+            # 스코프 종료 표식
+            if node is _LEAVE_FUNCTION:
+                self.current_function = None
+                self._context_lower = None
+                continue
+            if node is _LEAVE_CLASS:
+                self.current_class = None
+                self._context_lower = None
+                continue
+
+            node_type = type(node)
+            handler = handlers.get(node_type)
+            if handler is not None:
+                handler(node)
+            elif node_type is ast.FunctionDef or node_type is ast.AsyncFunctionDef:
+                self.current_function = node.name
+                self._context_lower = None
+                push(_LEAVE_FUNCTION)
+            elif node_type is ast.ClassDef:
+                self.current_class = node.name
+                self._context_lower = None
+                push(_LEAVE_CLASS)
+
+            # 자식은 역순으로 쌓아 NodeVisitor와 같은 방문 순서 유지
+            # (ctx/연산자 등 탐지 대상이 없는 말단 필드는 건너뜀)
+            for name in reversed(node._fields):
+                if name in _LEAF_FIELDS:
+                    continue
+                value = getattr(node, name, None)
+                if value.__class__ is list:
+                    for item in reversed(value):
+                        if isinstance(item, AST):
+                            push(item)
+                elif isinstance(value, AST):
+                    push(value)
 
     def visit_Call(self, node):
         """함수 호출 탐지"""
         call_name = self._get_call_name(node)
+        pattern = self._normalize_call_name(call_name)
+        if not pattern.startswith(self._TRIGGER_PREFIXES):
+            return
 
-        # np.random 패턴 탐지
-        for pattern, severity in self.FAKE_DATA_PATTERNS.items():
-            if pattern in call_name:
-                if not self._is_allowed_context():
-                    self.issues.append(Issue(
-                        severity=severity,
-                        file=self.filename,
-                        line=node.lineno,
-                        message=f"가짜 데이터 생성 패턴: {call_name}",
-                        pattern=pattern,
-                        suggestion="실제 API 데이터 또는 검증된 데이터 소스 사용"
-                    ))
-
-        self.generic_visit(node)
+        # np.random 패턴 탐지 (정규화된 전체 호출 이름으로 정확히 조회)
+        severity = self.FAKE_DATA_PATTERNS.get(pattern)
+        if severity and not self._is_allowed_context():
+            self.issues.append(Issue(
+                severity=severity,
+                file=self.filename,
+                line=node.lineno,
+                message=f"가짜 데이터 생성 패턴: {call_name}",
+                pattern=pattern,
+                suggestion="실제 API 데이터 또는 검증된 데이터 소스 사용"
+            ))
 
     def visit_Assign(self, node):
         """할당문 탐지 - 피처 생성 매직 넘버"""
-        line = self._get_source_line(node.lineno)
-
         # 피처 할당에서 하드코딩된 비율 탐지
         for target in node.targets:
             if isinstance(target, ast.Name):
                 var_name = target.id
+                var_name_lower = var_name.lower()
 
                 # 피처 변수에 np.random 사용
-                if any(kw in var_name.lower() for kw in self.FEATURE_PATTERNS):
-                    if "np.random" in line or "random." in line:
+                if any(kw in var_name_lower for kw in self.FEATURE_PATTERNS):
+                    if self._has_random_call(node.value):
                         self.issues.append(Issue(
                             severity="CRITICAL",
                             file=self.filename,
@@ -180,7 +288,7 @@ class FakeDataDetector(ast.NodeVisitor):
                         ))
 
                     # 매직 넘버 (0.6 * something 패턴)
-                    if re.search(r"=\s*\d+\.\d+\s*\*", line):
+                    if self._is_magic_number_product(node.value):
                         self.issues.append(Issue(
                             severity="WARNING",
                             file=self.filename,
@@ -190,8 +298,6 @@ class FakeDataDetector(ast.NodeVisitor):
                             suggestion="상수로 정의하거나 설정 파일에서 로드"
                         ))
 
-        self.generic_visit(node)
-
     def visit_ExceptHandler(self, node):
         """예외 은폐 탐지"""
         if not node.body or all(isinstance(n, ast.Pass) for n in node.body):
@@ -204,16 +310,14 @@ class FakeDataDetector(ast.NodeVisitor):
                 suggestion="적절한 에러 처리 또는 로깅 추가"
             ))
 
-        self.generic_visit(node)
-
     def _detect_text_patterns(self):
-        """텍스트 기반 패턴 탐지"""
-        for i, line in enumerate(self.lines, 1):
-            # 주석 제외
-            code_line = line.split("#")[0]
+        """텍스트 기반 패턴 탐지 (라인 루프 대신 소스 전체에 정규식 실행)"""
+        success_lines = self._match_lines(_RE_FAKE_SUCCESS)
+        todo_lines = self._match_lines(_RE_TODO_PASS) if b"TODO" in self.source else set()
 
+        for i in sorted(success_lines | todo_lines):
             # 가짜 성공 메시지 (한국어/영어)
-            if re.search(r'print\s*\(\s*["\'].*(?:완료|success|done)', line, re.IGNORECASE):
+            if i in success_lines:
                 self.issues.append(Issue(
                     severity="WARNING",
                     file=self.filename,
@@ -224,7 +328,7 @@ class FakeDataDetector(ast.NodeVisitor):
                 ))
 
             # TODO + pass 패턴
-            if "TODO" in line and "pass" in code_line:
+            if i in todo_lines:
                 self.issues.append(Issue(
                     severity="WARNING",
                     file=self.filename,
@@ -234,41 +338,178 @@ class FakeDataDetector(ast.NodeVisitor):
                     suggestion="구현 완료 또는 NotImplementedError 사용"
                 ))
 
+    def _match_lines(self, pattern) -> Set[int]:
+        """패턴이 매칭된 라인 번호 집합 (매칭 사이 개행 수로 라인 계산)"""
+        lines = set()
+        lineno, pos = 1, 0
+        for m in pattern.finditer(self.source):
+            lineno += self.source.count(b"\n", pos, m.start())
+            pos = m.start()
+            lines.add(lineno)
+        return lines
+
     def _get_call_name(self, node) -> str:
-        """호출 이름 추출"""
-        parts = []
+        """호출 이름 추출 (속성 체인을 뒤에서부터 문자열로 조립)"""
+        tail = ""
         current = node.func
 
-        while True:
-            if isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            elif isinstance(current, ast.Name):
-                parts.append(current.id)
-                break
-            else:
-                break
-
-        return ".".join(reversed(parts))
-
-    def _get_source_line(self, lineno: int) -> str:
-        """소스 라인 추출"""
-        if 0 < lineno <= len(self.lines):
-            return self.lines[lineno - 1]
-        return ""
+        while isinstance(current, ast.Attribute):
+            tail = f"{current.attr}.{tail}" if tail else current.attr
+            current = current.value
+
+        if isinstance(current, ast.Name):
+            return f"{current.id}.{tail}" if tail else current.id
+        return tail
+
+    @staticmethod
+    def _normalize_call_name(call_name: str) -> str:
+        """numpy.* 호출을 np.* 로 정규화 (패턴 비교용)"""
+        if call_name.startswith("numpy."):
+            return "np." + call_name[len("numpy."):]
+        return call_name
+
+    def _has_random_call(self, value) -> bool:
+        """할당 값에 np.random (numpy.random) / random. 호출이 포함되어 있는지 확인"""
+        for child in ast.walk(value):
+            if isinstance(child, ast.Call):
+                call_name = self._normalize_call_name(self._get_call_name(child))
+                if call_name.startswith(("np.random", "random.")):
+                    return True
+        return False
+
+    @staticmethod
+    def _is_magic_number_product(value) -> bool:
+        """실수 리터럴로 시작하는 곱셈인지 확인 (0.6 * something 패턴)"""
+        op = None
+        while isinstance(value, ast.BinOp):
+            op = value.op
+            value = value.left
+        return (isinstance(op, ast.Mult)
+                and isinstance(value, ast.Constant)
+                and isinstance(value.value, float))
 
     def _is_allowed_context(self) -> bool:
         """허용된 컨텍스트인지 확인"""
-        context = f"{self.current_class or ''}.{self.current_function or ''}"
-        return any(allowed in context.lower() for allowed in self.ALLOWED_CONTEXTS)
+        if self._context_lower is None:
+            self._context_lower = f"{self.current_class or ''}.{self.current_function or ''}".lower()
+        return any(allowed in self._context_lower for allowed in self._ALLOWED_TUPLE)
+
 
+class PersistentCache:
+    """파일 내용 해시 기반 스캔 결과 디스크 캐시 (LRU 정리)"""
 
-def scan_file(filepath: Path) -> List[Issue]:
+    # 캐시 형식이 바뀌면 올려서 기존 캐시 파일 정리
+    CACHE_VERSION = 3
+    MAX_BYTES = 50 * 1024 * 1024
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        # 탐지기 소스나 피처 패턴이 바뀌면 결과도 달라지므로 키에 포함
+        try:
+            detector_source = Path(__file__).read_bytes()
+        except OSError:
+            detector_source = b""
+        self._salt = (
+            hashlib.blake2b(detector_source, digest_size=16).digest()
+            + ",".join(FakeDataDetector.FEATURE_PATTERNS).encode()
+        )
+
+    def key(self, source: bytes) -> str:
+        """캐시 키 (내용 해시)"""
+        digest = hashlib.blake2b(self._salt + b"\0", digest_size=16)
+        digest.update(source)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"v{self.CACHE_VERSION}-{key}.json"
+
+    def get(self, key: str, filename: str) -> Optional[List[Issue]]:
+        """캐시된 이슈 조회 (없으면 None)"""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        # LRU 정리용 최근 사용 시각 갱신 (읽기 전용 캐시여도 적중 결과는 사용)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return [Issue(file=filename, **item) for item in data]
+
+    def put(self, key: str, issues: List[Issue]):
+        """이슈 저장 (파일 경로는 내용과 무관하므로 제외)"""
+        data = [{k: v for k, v in asdict(i).items() if k != "file"} for i in issues]
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 병렬 워커가 동시에 쓰므로 임시 파일에 쓴 뒤 원자적으로 교체
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # 캐시 쓰기 실패는 스캔 결과에 영향 없음
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def prune(self):
+        """오래된 버전 삭제 및 최대 크기 초과 시 LRU 순으로 정리"""
+        try:
+            entries = []
+            for path in self.cache_dir.glob("v*-*.json"):
+                if not path.name.startswith(f"v{self.CACHE_VERSION}-"):
+                    path.unlink()
+                    continue
+                st = path.stat()
+                entries.append((st.st_mtime, st.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.MAX_BYTES:
+                    break
+                path.unlink()
+                total -= size
+        except OSError:
+            pass
+
+
+# 이 중 하나도 없으면 (피처 매직 넘버 제외) 어떤 패턴도 탐지될 수 없음 (소문자 기준)
+_TRIGGERS = (b"random", b"faker", b"print", b"except", b"todo")
+
+
+def _has_trigger(source: bytes) -> bool:
+    """탐지 가능성이 있는 파일인지 바이트 검색으로 빠르게 확인"""
+    lowered = source.lower()
+    if any(t in lowered for t in _TRIGGERS):
+        return True
+
+    # 피처 매직 넘버: 피처 변수명 + 곱셈
+    return b"*" in source and any(
+        kw.encode() in lowered for kw in FakeDataDetector.FEATURE_PATTERNS
+    )
+
+
+def scan_file(filepath: Path, cache: Optional[PersistentCache] = None) -> List[Issue]:
     """파일 스캔"""
     try:
-        source = filepath.read_text(encoding="utf-8")
-        detector = FakeDataDetector(source, str(filepath))
-        return detector.detect()
+        source = filepath.read_bytes()
+        # 트리거 문자열이 없으면 AST 파싱 생략
+        if not _has_trigger(source):
+            return []
+        if cache is None:
+            return FakeDataDetector(source, str(filepath)).detect()
+
+        key = cache.key(source)
+        issues = cache.get(key, str(filepath))
+        if issues is None:
+            issues = FakeDataDetector(source, str(filepath)).detect()
+            cache.put(key, issues)
+        return issues
     except Exception as e:
         return [Issue(
             severity="WARNING",
@@ -279,34 +520,75 @@ def scan_file(filepath: Path) -> List[Issue]:
         )]
 
 
-def scan_directory(dirpath: Path, exclude_patterns: List[str] = None) -> DetectionResult:
-    """디렉토리 스캔"""
+def _iter_py_files(dirpath: str, exclude_patterns: List[str]):
+    """제외 디렉토리는 내려가지 않고 .py 파일만 순회"""
+    try:
+        entries = list(os.scandir(dirpath))
+    except OSError:
+        return
+
+    for entry in entries:
+        # 사용자 제외 패턴 (경로 부분 문자열)
+        if exclude_patterns and any(excl in entry.path for excl in exclude_patterns):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if not any(excl in entry.name for excl in EXCLUDE_DIR_SET):
+                yield from _iter_py_files(entry.path, exclude_patterns)
+        elif entry.name.endswith(".py") and entry.is_file():
+            yield Path(entry.path)
+
+
+def _scan_chunk(files: List[Path], cache: Optional[PersistentCache]) -> List[List[Issue]]:
+    """워커 프로세스용 파일 묶음 스캔"""
+    return [scan_file(py_file, cache) for py_file in files]
+
+
+def scan_directory(dirpath: Path, exclude_patterns: List[str] = None,
+                   cache: Optional[PersistentCache] = None,
+                   fail_fast: bool = False) -> DetectionResult:
+    """디렉토리 스캔 (fail_fast: 첫 CRITICAL 발견 시 중단)"""
     # 환경 변수에서 제외 패턴 로드
     env_excludes = os.environ.get("FAKE_DATA_EXCLUDE_PATHS", "").split(",")
     env_excludes = [e.strip() for e in env_excludes if e.strip()]
 
     exclude_patterns = exclude_patterns or []
     exclude_patterns.extend(env_excludes)
-    exclude_patterns.extend([
-        "__pycache__",
-        ".git",
-        "trash",
-        "archive",
-        ".venv",
-        "venv",
-        "node_modules",
-    ])
 
     result = DetectionResult()
 
-    for py_file in dirpath.rglob("*.py"):
-        # 제외 패턴 체크
-        if any(excl in str(py_file) for excl in exclude_patterns):
-            continue
+    files = list(_iter_py_files(str(dirpath), exclude_patterns))
 
-        issues = scan_file(py_file)
-        result.issues.extend(issues)
+    # 파일별 독립 작업이므로 프로세스 풀로 병렬 스캔 (파일이 적으면 기동 비용이 더 큼)
+    if len(files) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor() as executor:
+                futures = [
+                    executor.submit(_scan_chunk, files[i:i + SCAN_CHUNK_SIZE], cache)
+                    for i in range(0, len(files), SCAN_CHUNK_SIZE)
+                ]
+                for future in futures:
+                    for issues in future.result():
+                        result.extend(issues)
+                        result.files_scanned += 1
+
+                        # 결과가 이미 FAIL로 확정되면 남은 파일은 스캔하지 않음
+                        # (shutdown의 cancel_futures는 3.9+ 이므로 직접 취소)
+                        if fail_fast and result.critical_count > 0:
+                            for pending in futures:
+                                pending.cancel()
+                            return result
+            return result
+        except (BrokenProcessPool, NotImplementedError, ImportError, OSError):
+            # 프로세스 풀 사용 불가 시 남은 파일은 순차 스캔
+            # (sem_open 미지원/세마포어 부족은 NotImplementedError로 발생)
+            pass
+
+    # 묶음 결과는 파일 순서대로 반영되므로 처리된 개수 이후부터 이어서 스캔
+    for py_file in files[result.files_scanned:]:
+        result.extend(scan_file(py_file, cache))
         result.files_scanned += 1
+        if fail_fast and result.critical_count > 0:
+            break
 
     return result
 
@@ -328,9 +610,11 @@ def format_report(result: DetectionResult) -> str:
     if result.issues:
         lines.append("\nIssues found:\n")
 
-        # 심각도별 정렬
-        severity_order = {"CRITICAL": 0, "WARNING": 1, "INFO": 2}
-        sorted_issues = sorted(result.issues, key=lambda x: severity_order.get(x.severity, 9))
+        # 심각도별 정렬 (심각도 종류가 적으므로 버킷 분배, 버킷 내 순서 유지)
+        buckets = {"CRITICAL": [], "WARNING": [], "INFO": []}
+        for issue in result.issues:
+            buckets.setdefault(issue.severity, []).append(issue)
+        sorted_issues = [issue for bucket in buckets.values() for issue in bucket]
 
         for issue in sorted_issues:
             emoji = {"CRITICAL": "🔴", "WARNING": "🟡", "INFO": "🔵"}.get(issue.severity, "⚪")
@@ -358,34 +642,49 @@ def main():
   %(prog)s . --ci            # CI 모드 (GitHub Actions 형식)
   %(prog)s . --strict        # WARNING도 실패로 처리
   %(prog)s . --json          # JSON 출력
+  %(prog)s . --ci --fail-fast  # 첫 CRITICAL 발견 시 즉시 중단
 
 환경 변수:
   FAKE_DATA_FEATURE_PATTERNS  피처 변수 패턴 (콤마 구분, 기본: feature,program,arbitrage)
   FAKE_DATA_EXCLUDE_PATHS     제외 경로 (콤마 구분)
+  FAKE_DATA_CACHE_DIR         스캔 결과 캐시 디렉토리 (설정 시에만 캐시 사용)
         """
     )
     parser.add_argument("paths", nargs="*", default=["."], help="파일 또는 디렉토리 경로")
     parser.add_argument("--strict", action="store_true", help="WARNING도 실패로 처리")
     parser.add_argument("--json", action="store_true", help="JSON 출력")
     parser.add_argument("--ci", action="store_true", help="CI 모드 (GitHub Actions 형식)")
+    parser.add_argument("--no-cache", action="store_true", help="스캔 결과 캐시 사용 안 함")
+    parser.add_argument("--fail-fast", action="store_true", help="첫 CRITICAL 발견 시 스캔 중단")
     args = parser.parse_args()
 
+    # 캐시는 opt-in (사용 프로젝트 작업 디렉토리에 파일을 만들지 않도록)
+    cache = None
+    cache_dir = os.environ.get("FAKE_DATA_CACHE_DIR")
+    if cache_dir and not args.no_cache:
+        cache = PersistentCache(Path(cache_dir))
+
     result = DetectionResult()
 
     for path_str in args.paths:
         path = Path(path_str)
         if path.is_file():
-            issues = scan_file(path)
-            result.issues.extend(issues)
+            issues = scan_file(path, cache)
+            result.extend(issues)
             result.files_scanned += 1
         elif path.is_dir():
-            dir_result = scan_directory(path)
-            result.issues.extend(dir_result.issues)
+            dir_result = scan_directory(path, cache=cache, fail_fast=args.fail_fast)
+            result.extend(dir_result.issues)
             result.files_scanned += dir_result.files_scanned
 
+        if args.fail_fast and result.critical_count > 0:
+            break
+
+    if cache is not None:
+        cache.prune()
+
     # 출력
     if args.json:
-        import json
         output = {
             "files_scanned": result.files_scanned,
             "critical_count": result.critical_count,
@@ -405,10 +704,13 @@ def main():
         }
         print(json.dumps(output, indent=2, ensure_ascii=False))
     elif args.ci:
-        # GitHub Actions 형식
-        for issue in result.issues:
-            level = "error" if issue.severity == "CRITICAL" else "warning"
-            print(f"::{level} file={issue.file},line={issue.line}::{issue.message}")
+        # GitHub Actions 형식 (이슈별 print 대신 한 번에 출력)
+        if result.issues:
+            sys.stdout.write("".join(
+                f"::{'error' if i.severity == 'CRITICAL' else 'warning'} "
+                f"file={i.file},line={i.line}::{i.message}\n"
+                for i in result.issues
+            ))
     else:
         print(format_report(result))
 